@@ -2,8 +2,12 @@
 from __future__ import annotations
 
 import reflex as rx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import FileResponse, PlainTextResponse
+from starlette.routing import Route
 
-from bearhub.core import system
+from bearhub.core import runner, system
 
 system.bootstrap_env()
 
@@ -15,8 +19,22 @@ from bearhub.pages.status import status_page
 from bearhub.pages.tools import tools_page
 from bearhub.state import BactopiaState, MerlinState, RunsState, StatusState, ToolsState
 
+
+async def _run_log(request: Request):
+    """Serve a run's full on-disk log as a file download (see RunsState.download_log)."""
+    run_id = request.path_params["run_id"]
+    path = runner.run_log_file(run_id)
+    if path is None:
+        return PlainTextResponse("No log on disk for this run.", status_code=404)
+    return FileResponse(path, media_type="text/plain; charset=utf-8",
+                        filename=f"{run_id}.log")
+
+
 app = rx.App(
-    theme=rx.theme(accent_color="indigo", gray_color="slate", radius="medium", appearance="light")
+    theme=rx.theme(accent_color="indigo", gray_color="slate", radius="medium", appearance="light"),
+    api_transformer=Starlette(routes=[
+        Route(f"{runner.RUN_LOG_ROUTE}/{{run_id}}", _run_log),
+    ]),
 )
 app.add_page(hub_page, route="/", title="BEAR-HUB")
 app.add_page(
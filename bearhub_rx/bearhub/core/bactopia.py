@@ -1,6 +1,7 @@
 """Bactopia filesystem helpers: sample discovery, directory utilities."""
 from __future__ import annotations
 
+import functools
 import os
 import pathlib
 
@@ -11,7 +12,7 @@ from bearhub.core.system import get_default_outdir
 _RESERVED_DIRS = {".nextflow", "bactopia-runs", "work", "logs", "nf-reports"}
 
 
-def _is_sample_dir(child: pathlib.Path) -> bool:
+def _is_sample_dir(child: str | os.PathLike) -> bool:
     """True only for genuine Bactopia per-sample output folders.
 
     A Bactopia 4.x sample directory contains a ``main/`` (core pipeline output)
@@ -19,10 +20,8 @@ def _is_sample_dir(child: pathlib.Path) -> bool:
     markers so that pointing the picker at an arbitrary directory (e.g. ``$HOME``)
     never lists unrelated folders like ``.ssh`` or ``Downloads`` as "samples".
     """
-    try:
-        return (child / "main").is_dir() or (child / "tools").is_dir()
-    except OSError:
-        return False
+    return (os.path.isdir(os.path.join(child, "main"))
+            or os.path.isdir(os.path.join(child, "tools")))
 
 
 def discover_samples(outdir: str | None = None) -> list[str]:
@@ -34,20 +33,21 @@ def discover_samples(outdir: str | None = None) -> list[str]:
     """
     if not outdir:
         return []
-    p = pathlib.Path(outdir)
-    if not p.is_dir():
+    try:
+        with os.scandir(outdir) as it:
+            entries = [e for e in it if e.is_dir()]
+    except OSError:
         return []
     samples: list[str] = []
-    for child in sorted(p.iterdir(), key=lambda x: x.name):
-        if not child.is_dir():
-            continue
+    for entry in sorted(entries, key=lambda e: e.name):
+        name = entry.name
         # Skip dotfiles, bactopia-* bookkeeping dirs, and reserved folders.
-        if child.name.startswith(".") or child.name.startswith("bactopia-"):
+        if name.startswith(".") or name.startswith("bactopia-"):
             continue
-        if child.name in _RESERVED_DIRS:
+        if name in _RESERVED_DIRS:
             continue
-        if _is_sample_dir(child):
-            samples.append(child.name)
+        if _is_sample_dir(entry.path):
+            samples.append(name)
     return samples
 
 
@@ -70,15 +70,24 @@ def guess_root_default() -> str:
     return get_default_outdir()
 
 
+@functools.lru_cache(maxsize=256)
+def _list_subdirs_cached(path: str, mtime_ns: int) -> tuple[str, ...]:
+    with os.scandir(path) as it:
+        return tuple(sorted(
+            e.name for e in it
+            if not e.name.startswith(".") and e.is_dir()
+        ))
+
+
 def list_subdirs(path: str) -> list[str]:
-    """Visible subdirectory names (for the directory picker)."""
-    p = pathlib.Path(path).expanduser().resolve()
+    """Visible subdirectory names (for the directory picker).
+
+    Listings are memoized on (path, directory mtime), so clicking back and
+    forth through the picker only rescans a folder after its entries change.
+    """
+    p = str(pathlib.Path(path).expanduser().resolve())
     try:
-        return sorted(
-            str(child.name)
-            for child in p.iterdir()
-            if child.is_dir() and not child.name.lower().startswith(".")
-        )
+        return list(_list_subdirs_cached(p, os.stat(p).st_mtime_ns))
     except (PermissionError, OSError):
         return []
 
@@ -6,9 +6,13 @@ samples file with columns: sample, runtype, genome_size, species, r1, r2, extra.
 """
 from __future__ import annotations
 
+import contextlib
+import functools
+import itertools
 import os
 import pathlib
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 # ── File-type patterns ─────────────────────────────────────────────────────────
 
@@ -16,10 +20,9 @@ FASTQ_PATTERNS: tuple[str, ...] = ("*.fastq.gz", "*.fq.gz", "*.fastq", "*.fq")
 FA_PATTERNS: tuple[str, ...] = (
     "*.fna.gz", "*.fa.gz", "*.fasta.gz", "*.fna", "*.fa", "*.fasta"
 )
-_EXTS: tuple[str, ...] = (
-    ".fastq.gz", ".fq.gz", ".fastq", ".fq",
-    ".fna.gz", ".fa.gz", ".fasta.gz", ".fna", ".fa", ".fasta",
-)
+# Suffix forms of the patterns above, for str.endswith during the tree walk.
+FASTQ_EXTS: tuple[str, ...] = tuple(p[1:] for p in FASTQ_PATTERNS)
+FA_EXTS: tuple[str, ...] = tuple(p[1:] for p in FA_PATTERNS)
 
 # R1/R2 detection patterns
 PE1_PATTERNS: tuple[re.Pattern, ...] = (
@@ -34,78 +37,192 @@ PE2_PATTERNS: tuple[re.Pattern, ...] = (
 )
 LANE_SUFFIX: re.Pattern = re.compile(r"(_L\d{3,4})?(_\d{3})?$")
 
-# ONT path keywords (for infer_ont_by_name)
+
+def _alternation(patterns: tuple[re.Pattern, ...]) -> re.Pattern:
+    """Fold anchored patterns into one regex that tries them in order.
+
+    Each alternative keeps exactly one (unnamed) capture group for the sample
+    root, so ``m.group(m.lastindex)`` is the root of whichever one matched.
+    """
+    return re.compile("|".join(
+        f"(?:{p.pattern.replace('(?P<root>', '(', 1)})" for p in patterns
+    ))
+
+
+_PE1_RE: re.Pattern = _alternation(PE1_PATTERNS)
+_PE2_RE: re.Pattern = _alternation(PE2_PATTERNS)
+# Any one read/assembly extension (optionally gzipped), anchored at the end.
+_EXT_RE: re.Pattern = re.compile(r"\.(?:fastq|fq|fna|fa|fasta)(?:\.gz)?$")
+
+# Folders never descended during discovery: VCS/tool caches, and BEAR-HUB's
+# default output folder (its per-sample QC'd reads would be picked up as extra
+# inputs; pointing discovery *at* an outdir still scans it, only nested ones are
+# skipped). A Nextflow launch dir's `work/` (see _scan_dir) holds staged copies
+# of every input, so it is skipped too.
+_PRUNE_DIRS: frozenset[str] = frozenset(
+    {".git", ".nextflow", "node_modules", "__pycache__", "bactopia_out"}
+)
+
+# Threads for the discovery walk (I/O-bound: scandir releases the GIL).
+_SCAN_WORKERS = 8
+
+# ONT path keywords (for infer_ont_by_name), folded into one scan.
 _ONT_KEYWORDS = ("ont", "nanopore", "minion", "oxford", "promethion")
+_ONT_RE: re.Pattern = re.compile("|".join(map(re.escape, _ONT_KEYWORDS)))
+
+# Genome-size parsing (see parse_genome_size).
+_WS_RE: re.Pattern = re.compile(r"\s+")
+_MB_RE: re.Pattern = re.compile(r"^([\d.]+)[Mm][Bb]?$")
+_GB_RE: re.Pattern = re.compile(r"^([\d.]+)[Gg][Bb]?$")
+_NON_DIGIT_RE: re.Pattern = re.compile(r"[^\d]")
 
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
 def _drop_exts(name: str) -> str:
-    for ext in _EXTS:
-        if name.endswith(ext):
-            return name[: len(name) - len(ext)]
-    return name
+    return _EXT_RE.sub("", name, count=1)
 
 
-def _infer_root_and_tag(path: pathlib.Path) -> tuple[str, str]:
-    """Return (sample_root, 'PE1'|'PE2'|'SE') for a FASTQ path."""
-    name = _drop_exts(path.name)
-    name = LANE_SUFFIX.sub("", name)
-    for pat in PE1_PATTERNS:
-        m = pat.match(name)
-        if m:
-            return m.group("root"), "PE1"
-    for pat in PE2_PATTERNS:
-        m = pat.match(name)
-        if m:
-            return m.group("root"), "PE2"
+@functools.lru_cache(maxsize=4096)
+def _root_and_tag(filename: str) -> tuple[str, str]:
+    name = LANE_SUFFIX.sub("", _drop_exts(filename))
+    m = _PE1_RE.match(name)
+    if m:
+        return m.group(m.lastindex), "PE1"
+    m = _PE2_RE.match(name)
+    if m:
+        return m.group(m.lastindex), "PE2"
     return name, "SE"
 
 
+def _infer_root_and_tag(path: pathlib.Path) -> tuple[str, str]:
+    """Return (sample_root, 'PE1'|'PE2'|'SE') for a FASTQ path.
+
+    Only the file name matters, so the work is memoized per name — rescanning
+    the same folder (or re-scanning after a tweak) skips the regexes.
+    """
+    return _root_and_tag(path.name)
+
+
 def _is_probably_ont(p: pathlib.Path, s: str) -> bool:
     """True if the file path or sample name hints at Oxford Nanopore."""
-    return any(k in str(p.as_posix()).lower() or k in s.lower()
-               for k in _ONT_KEYWORDS)
+    return bool(_ONT_RE.search(p.as_posix().lower())
+                or _ONT_RE.search(s.lower()))
 
 
-def _collect(base: pathlib.Path, patterns: tuple[str, ...],
-             recursive: bool) -> list[pathlib.Path]:
-    out: list[pathlib.Path] = []
+def _scan_dir(path: str, fa_exts: tuple[str, ...], fastqs: list[pathlib.Path],
+              fastas: list[pathlib.Path], subdirs: list[str]) -> None:
+    """Classify one directory's entries, queueing its subdirectories.
+
+    File/dir types come from the scandir entries (d_type), so a matching file
+    costs no extra stat. Symlinked directories are not queued, as with rglob,
+    and neither are _PRUNE_DIRS.
+    """
     try:
-        for pat in patterns:
-            fn = base.rglob if recursive else base.glob
-            for p in sorted(fn(pat)):
-                if p.is_file():
-                    # os.path.abspath: absolute + normalises '..' but does NOT
-                    # follow symlinks. Critical: preserves the user's filename and
-                    # folder layout (e.g. nanopore/) so sample classification and
-                    # ONT inference work even when data is organised with symlinks.
-                    out.append(pathlib.Path(os.path.abspath(p)))
+        it = os.scandir(path)
     except OSError:
-        pass
-    return list(dict.fromkeys(out))  # deduplicate preserving order
+        return  # unreadable folder: skip it, as os.walk did
+    work = None
+    launch_dir = False
+    with it:
+        for e in it:
+            name = e.name
+            if name.endswith(FASTQ_EXTS):
+                out = fastqs
+            elif fa_exts and name.endswith(fa_exts):
+                out = fastas
+            else:
+                if name in _PRUNE_DIRS:
+                    launch_dir = launch_dir or (name == ".nextflow" and e.is_dir())
+                elif name == "work" and e.is_dir(follow_symlinks=False):
+                    work = e.path  # queued below unless this is a launch dir
+                elif e.is_dir(follow_symlinks=False):
+                    subdirs.append(e.path)
+                continue
+            # is_file() follows symlinks, so linked reads are still found.
+            if e.is_file():
+                out.append(pathlib.Path(e.path))
+            elif e.is_dir(follow_symlinks=False):
+                subdirs.append(e.path)  # e.g. a folder named "x.fastq"
+    if work and not launch_dir:
+        subdirs.append(work)
+
+
+def _walk(top: str, fa_exts: tuple[str, ...]) -> tuple[list[pathlib.Path], list[pathlib.Path]]:
+    """Depth-first scan of the whole tree under `top`."""
+    fastqs: list[pathlib.Path] = []
+    fastas: list[pathlib.Path] = []
+    stack = [top]
+    while stack:
+        _scan_dir(stack.pop(), fa_exts, fastqs, fastas, stack)
+    return fastqs, fastas
+
+
+def _collect(base: pathlib.Path, recursive: bool,
+             with_fasta: bool) -> tuple[list[pathlib.Path], list[pathlib.Path]]:
+    """Find (fastqs, fastas) under base in ONE directory walk.
+
+    Every file name is matched against both suffix tuples, instead of one
+    glob/rglob sweep of the whole tree per pattern (ten sweeps in total).
+    Discovery is readdir-bound and often on network storage, so each top-level
+    subfolder is walked in its own thread to overlap the directory reads.
+    """
+    fastqs: list[pathlib.Path] = []
+    fastas: list[pathlib.Path] = []
+    subdirs: list[str] = []
+    fa_exts = FA_EXTS if with_fasta else ()
+    # os.path.abspath: absolute + normalises '..' but does NOT follow symlinks.
+    # Critical: preserves the user's filename and folder layout (e.g. nanopore/)
+    # so sample classification and ONT inference work even when data is
+    # organised with symlinks. Done once on the root: every path the walk
+    # yields below it is then already absolute and normalised.
+    _scan_dir(os.path.abspath(base), fa_exts, fastqs, fastas, subdirs)
+    if recursive and subdirs:
+        with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(subdirs))) as ex:
+            for fq, fa in ex.map(_walk, subdirs, itertools.repeat(fa_exts)):
+                fastqs += fq
+                fastas += fa
+    return fastqs, fastas
+
+
+@contextlib.contextmanager
+def _replacing(path: str):
+    """Write `path` via a temp sibling that is renamed over it on success.
+
+    os.replace is atomic on POSIX, so Nextflow (or the editor) never reads a
+    half-written sheet, and a failed build leaves the previous one intact.
+    """
+    tmp = f"{path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp, "w", encoding="utf-8", buffering=1 << 20) as fh:
+            yield fh
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
 
 
 def parse_genome_size(raw: str) -> str:
     """Convert human-readable genome size (e.g. '5.5 Mb', '5500000') to bp string."""
     if not raw:
         return ""
-    clean = re.sub(r"\s+", "", raw, flags=re.IGNORECASE)
+    clean = _WS_RE.sub("", raw)
     # numeric Mb/Gb suffix
-    m = re.match(r"^([\d.]+)[Mm][Bb]?$", clean, re.IGNORECASE)
+    m = _MB_RE.match(clean)
     if m:
         try:
             return str(int(float(m.group(1)) * 1_000_000))
         except ValueError:
             pass
-    m = re.match(r"^([\d.]+)[Gg][Bb]?$", clean, re.IGNORECASE)
+    m = _GB_RE.match(clean)
     if m:
         try:
             return str(int(float(m.group(1)) * 1_000_000_000))
         except ValueError:
             pass
     # plain integer
-    digits = re.sub(r"[^\d]", "", clean)
+    digits = _NON_DIGIT_RE.sub("", clean)
     if digits:
         return digits
     return ""
@@ -121,6 +238,41 @@ def _pick(paths: list[pathlib.Path], merge_multi: bool) -> str:
         return str(paths[0])
 
 
+# File groups per sample, in presence-mask bit order.
+_GROUPS = ("PE1", "PE2", "SE", "ont", "fa")
+
+
+def _classify(pe1: bool, pe2: bool, se: bool, ont: bool, fa: bool) -> str | None:
+    """Runtype for a sample's file-group presence, or None if unclassifiable."""
+    if fa and not (pe1 or pe2 or se or ont):
+        return "assembly"
+    if pe1 and pe2 and ont:
+        return "hybrid"
+    if pe1 and pe2:
+        return "paired-end"
+    if ont and not (pe1 or pe2):
+        return "ont"
+    if se and not (pe1 or pe2 or ont):
+        return "single-end"
+    return None
+
+
+# Every presence combination resolved once, so each sample is a single lookup.
+_RUNTYPE_BY_MASK: dict[int, str | None] = {
+    mask: _classify(*(bool(mask >> i & 1) for i in range(len(_GROUPS))))
+    for mask in range(1 << len(_GROUPS))
+}
+
+# FOFN column → file group it is filled from, per runtype.
+_RUNTYPE_COLUMNS: dict[str, tuple[tuple[str, str], ...]] = {
+    "assembly":   (("assembly", "fa"),),
+    "hybrid":     (("r1", "PE1"), ("r2", "PE2"), ("ont", "ont")),
+    "paired-end": (("r1", "PE1"), ("r2", "PE2")),
+    "ont":        (("ont", "ont"),),
+    "single-end": (("se", "SE"),),
+}
+
+
 def build_fofn(
     base_dir: str,
     *,
@@ -151,8 +303,7 @@ def build_fofn(
         raise FileNotFoundError(f"Base folder does not exist: {base_dir}")
     pathlib.Path(fofn_path).parent.mkdir(parents=True, exist_ok=True)
 
-    fastqs = _collect(base, FASTQ_PATTERNS, recursive)
-    fastas = _collect(base, FA_PATTERNS, recursive) if include_assemblies else []
+    fastqs, fastas = _collect(base, recursive, include_assemblies)
 
     # Group fastqs by (sample_root, tag)
     by_sample: dict[str, dict[str, list[pathlib.Path]]] = {}
@@ -175,71 +326,58 @@ def build_fofn(
     # Bactopia 4.0 canonical FOFN header — dedicated columns per read type.
     header = ["sample", "runtype", "genome_size", "species",
               "r1", "r2", "se", "ont", "assembly"]
-    rows: list[list[str]] = []
+    n_rows = 0
     issues: list[str] = []
     counts: dict[str, int] = {}
 
-    for sample in all_samples:
-        fq = by_sample.get(sample, {})
-        fa = fa_by_sample.get(sample, [])
-
-        pe1 = fq.get("PE1", [])
-        pe2 = fq.get("PE2", [])
-        se  = fq.get("SE", [])
-        ont = fq.get("ont", [])
-
-        # Validate PE pairing
-        if pe1 and not pe2:
-            issues.append(f"{sample}: R1 found without R2.")
-        if pe2 and not pe1:
-            issues.append(f"{sample}: R2 found without R1.")
-
-        # Dedicated column slots (r1, r2, se, ont, assembly)
-        c_r1 = c_r2 = c_se = c_ont = c_asm = ""
-
-        if fa and (pe1 or pe2 or se or ont):
-            issues.append(
-                f"{sample}: FASTA and FASTQ detected; ignoring assembly in FOFN."
-            )
-            fa = []  # fall through to FASTQ classification below
-
-        # Classify
-        if fa and not (pe1 or pe2 or se or ont):
-            runtype = "assembly"
-            c_asm = _pick(fa, merge_multi)
-        elif pe1 and pe2 and ont:
+    # Rows are streamed straight into a large write buffer as they are
+    # classified, rather than collected into a list and joined afterwards.
+    with _replacing(fofn_path) as fh:
+        fh.write("\t".join(header) + "\n")
+        for sample in all_samples:
+            fq = by_sample.get(sample, {})
+            fa = fa_by_sample.get(sample, [])
+
+            pe1 = fq.get("PE1", [])
+            pe2 = fq.get("PE2", [])
+            se  = fq.get("SE", [])
+            ont = fq.get("ont", [])
+
+            # Validate PE pairing
+            if pe1 and not pe2:
+                issues.append(f"{sample}: R1 found without R2.")
+            if pe2 and not pe1:
+                issues.append(f"{sample}: R2 found without R1.")
+
+            if fa and (pe1 or pe2 or se or ont):
+                issues.append(
+                    f"{sample}: FASTA and FASTQ detected; ignoring assembly in FOFN."
+                )
+                fa = []  # fall through to FASTQ classification below
+
+            # Classify
+            groups = {"PE1": pe1, "PE2": pe2, "SE": se, "ont": ont, "fa": fa}
+            mask = sum(1 << i for i, g in enumerate(_GROUPS) if groups[g])
+            runtype = _RUNTYPE_BY_MASK[mask]
+            if runtype is None:
+                issues.append(f"{sample}: could not classify sample (missing files?).")
+                continue
+
+            # Dedicated column slots (r1, r2, se, ont, assembly)
+            cols = dict.fromkeys(("r1", "r2", "se", "ont", "assembly"), "")
+            for col, group in _RUNTYPE_COLUMNS[runtype]:
+                cols[col] = _pick(groups[group], merge_multi)
+
             # Dragonflye hybrid uses short_polish runtype; Unicycler uses hybrid.
-            runtype = ("short_polish"
-                       if "short_polish" in hybrid_strategy
-                       else "hybrid")
-            c_r1 = _pick(pe1, merge_multi)
-            c_r2 = _pick(pe2, merge_multi)
-            c_ont = _pick(ont, merge_multi)
-        elif pe1 and pe2:
-            runtype = "paired-end"
-            c_r1 = _pick(pe1, merge_multi)
-            c_r2 = _pick(pe2, merge_multi)
-        elif ont and not (pe1 or pe2):
-            runtype = "ont"
-            c_ont = _pick(ont, merge_multi)
-        elif se and not (pe1 or pe2 or ont):
-            runtype = "single-end"
-            c_se = _pick(se, merge_multi)
-        else:
-            issues.append(f"{sample}: could not classify sample (missing files?).")
-            continue
-
-        counts[runtype] = counts.get(runtype, 0) + 1
-        rows.append([sample, runtype, gsize, species or "UNKNOWN_SPECIES",
-                     c_r1, c_r2, c_se, c_ont, c_asm])
-
-    # Write FOFN
-    lines = ["\t".join(header)]
-    for row in rows:
-        lines.append("\t".join(row))
-    pathlib.Path(fofn_path).write_text("\n".join(lines) + "\n", encoding="utf-8")
-
-    return {"fofn_path": fofn_path, "rows": len(rows), "issues": issues, "counts": counts}
+            if runtype == "hybrid" and "short_polish" in hybrid_strategy:
+                runtype = "short_polish"
+
+            counts[runtype] = counts.get(runtype, 0) + 1
+            n_rows += 1
+            fh.write("\t".join((sample, runtype, gsize, species or "UNKNOWN_SPECIES",
+                                *cols.values())) + "\n")
+
+    return {"fofn_path": fofn_path, "rows": n_rows, "issues": issues, "counts": counts}
 
 
 # Canonical Bactopia 4.0 FOFN columns and the valid runtypes (for the editor).
@@ -267,11 +405,13 @@ def read_fofn(path: str) -> list[dict]:
 
 def write_fofn_rows(path: str, rows: list[dict]) -> int:
     """Rewrite a FOFN from edited row dicts (canonical column order). Returns count."""
-    out = ["\t".join(FOFN_HEADER)]
-    for r in rows:
-        out.append("\t".join(str(r.get(col, "")) for col in FOFN_HEADER))
     pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
-    pathlib.Path(path).write_text("\n".join(out) + "\n", encoding="utf-8")
+    with _replacing(path) as fh:
+        fh.write("\t".join(FOFN_HEADER) + "\n")
+        fh.writelines(
+            "\t".join([str(r.get(col, "")) for col in FOFN_HEADER]) + "\n"
+            for r in rows
+        )
     return len(rows)
 
 
@@ -57,6 +57,15 @@ def _path() -> pathlib.Path:
     return _HISTORY_FILE
 
 
+def signature() -> Optional[tuple[int, int]]:
+    """(mtime_ns, size) of the history file — changes on every rewrite."""
+    try:
+        st = os.stat(_HISTORY_FILE)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def _write(records: list[dict]) -> None:
     """Atomically rewrite the history file (write-temp-then-rename).
 
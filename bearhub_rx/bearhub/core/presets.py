@@ -7,22 +7,48 @@ pipeline's bopts/bflags) so users can save and reuse setups like
 from __future__ import annotations
 
 import json
+import os
 
 from bearhub.core.system import APP_STATE_DIR
 
 _FILE = APP_STATE_DIR / "presets.json"
 
+# ((mtime_ns, size), parsed data) of the last read. The preset picker re-lists
+# on every page load, but the file only changes through _save_all (or a hand
+# edit, which the stat signature also catches).
+_cache: tuple[tuple[int, int], dict] | None = None
+
+
+def _signature() -> tuple[int, int]:
+    st = os.stat(_FILE)
+    return st.st_mtime_ns, st.st_size
+
 
 def _load_all() -> dict:
+    global _cache
     try:
-        return json.loads(_FILE.read_text(encoding="utf-8"))
+        sig = _signature()
+    except OSError:
+        return {}
+    if _cache is not None and _cache[0] == sig:
+        return _cache[1]
+    try:
+        data = json.loads(_FILE.read_text(encoding="utf-8"))
     except (OSError, ValueError):
         return {}
+    _cache = (sig, data)
+    return data
 
 
 def _save_all(data: dict) -> None:
+    global _cache
+    _cache = None  # callers mutate the cached dict; never serve it if the write fails
     APP_STATE_DIR.mkdir(parents=True, exist_ok=True)
     _FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    try:
+        _cache = (_signature(), data)
+    except OSError:
+        pass
 
 
 def list_presets(ns: str) -> list[str]:
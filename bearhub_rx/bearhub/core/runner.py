@@ -2,11 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import hashlib
 import os
 import re
 import shlex
-import shutil
 import signal
 import subprocess
 import time
@@ -15,6 +15,8 @@ from bearhub.core.system import (
     APP_STATE_DIR,
     get_bactopia_version,
     get_nextflow_bin,
+    read_tail,
+    which,
 )
 from bearhub.core import history as _hist
 
@@ -25,6 +27,10 @@ MAX_LOG_LINES: int = 1500
 # + full-list re-serialization per line. The on-disk log stays line-immediate.
 FLUSH_LINES: int = 50
 FLUSH_SECS: float = 0.3
+# stdout read granularity. read() returns whatever is already buffered (up to
+# this much), so a large size never delays a line — it just lets a burst of
+# Nextflow status output arrive in one await instead of many 4 KiB ones.
+READ_SIZE: int = 65536
 
 # Per-namespace process registry (for stop()) and per-run_id registry (so any
 # page — chiefly Runs — can monitor/stop any active run, enabling parallelism).
@@ -35,6 +41,51 @@ _PROCS_BY_ID: dict[str, asyncio.subprocess.Process] = {}
 _ORPHANS: dict[str, int] = {}
 
 _LOG_DIR = APP_STATE_DIR / "logs"
+# Backend route serving a run's full log file (mounted in bearhub.py), so the
+# browser downloads it over HTTP instead of through the state websocket.
+RUN_LOG_ROUTE = "/api/run-log"
+_RUN_ID_RE = re.compile(r"[0-9A-Za-z_-]+")
+
+# Activity broadcast for pollers (the Runs page monitor), so they can sleep
+# until there is something new for *them* instead of on a fixed timer. The
+# counters say what changed: a run's output (per run_id) or the run list
+# (a run started/finished). _WAKE is replaced on every notify so each waiter
+# sees it, however many Runs tabs are open.
+_OUTPUT_SEQ: dict[str, int] = {}
+_HISTORY_SEQ = 0
+_WAKE = asyncio.Event()
+
+
+def _notify(run_id: str = "") -> None:
+    """Record new output for `run_id` (or a run list change when empty)."""
+    global _HISTORY_SEQ, _WAKE
+    if run_id:
+        _OUTPUT_SEQ[run_id] = _OUTPUT_SEQ.get(run_id, 0) + 1
+    else:
+        _HISTORY_SEQ += 1
+    _WAKE.set()
+    _WAKE = asyncio.Event()
+
+
+async def wait_activity(run_id: str, timeout: float) -> bool:
+    """Block until `run_id` emits output, any run starts or exits, or `timeout`.
+
+    Returns True when woken by activity. Output of other runs doesn't wake the
+    caller. Orphans adopted after a restart don't stream through this process,
+    so callers must keep a timeout as a fallback.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    start = (_HISTORY_SEQ, _OUTPUT_SEQ.get(run_id))
+    while (_HISTORY_SEQ, _OUTPUT_SEQ.get(run_id)) == start:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+        try:
+            await asyncio.wait_for(_WAKE.wait(), remaining)
+        except asyncio.TimeoutError:
+            return False
+    return True
 
 
 def _group_alive(pgid: int) -> bool:
@@ -76,16 +127,31 @@ def active_pgids() -> list[int]:
     return list(dict.fromkeys(pgids))
 
 
-def run_log_path(run_id: str) -> str:
-    """Path to a run's on-disk live log (written line-by-line by stream())."""
-    return str(_LOG_DIR / f"{run_id}.log")
+def run_log_file(run_id: str) -> str | None:
+    """Path to a run's on-disk live log, or None if it has none.
+
+    `run_id` may come straight from a URL (see RUN_LOG_ROUTE), so anything but
+    a plain history id is refused rather than joined onto _LOG_DIR.
+    """
+    if not _RUN_ID_RE.fullmatch(run_id):
+        return None
+    path = _LOG_DIR / f"{run_id}.log"
+    return str(path) if path.is_file() else None
+
+
+def log_signature(run_id: str) -> tuple[int, int] | None:
+    """(mtime_ns, size) of a run's on-disk log, or None if it has none yet."""
+    try:
+        st = os.stat(_LOG_DIR / f"{run_id}.log")
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
 
 def tail_run_log(run_id: str, n: int = MAX_LOG_LINES) -> list[str]:
     """Return the last `n` lines of a run's on-disk log (empty if none)."""
-    p = _LOG_DIR / f"{run_id}.log"
     try:
-        return p.read_text(encoding="utf-8", errors="replace").splitlines()[-n:]
+        return read_tail(_LOG_DIR / f"{run_id}.log", n)
     except OSError:
         return []
 
@@ -107,28 +173,28 @@ def is_active(run_id: str) -> bool:
 # ANSI escape sequence stripper
 _ANSI = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]", re.IGNORECASE)
 
-# Cursor-up escape (^[[<N>A) — rewind log lines for in-place progress bars
+# Cursor-up escape (^[[<N>A) — rewind log lines for in-place progress bars.
+# The count is captured, so split() alternates text, count, text, ...
 _CURSOR_UP = re.compile(r"\x1b\[(\d+)A")
-_NF_CLEANUP = re.compile(r"(?<!^)\s+(?=executor\s*>)", re.IGNORECASE)
 
 
 def _resolve_cursor_up(text: str) -> list[str]:
     """Expand ANSI cursor-up sequences so log lines replace earlier lines."""
-    parts = re.split(r"(\x1b\[\d+A)", text)
-    lines: list[str] = []
-    for part in parts:
-        m = _CURSOR_UP.fullmatch(part)
-        if m:
-            n = int(m.group(1))
-            del lines[-n:]
-        else:
-            lines.extend(part.split("\n"))
+    parts = _CURSOR_UP.split(text)
+    lines: list[str] = parts[0].split("\n")
+    for i in range(1, len(parts), 2):
+        del lines[-int(parts[i]):]
+        lines.extend(parts[i + 1].split("\n"))
     return lines
 
 
 def normalize_chunk(chunk: bytes) -> list[str]:
     """Decode and clean a raw stdout chunk into display lines."""
     text = chunk.decode("utf-8", errors="replace")
+    # Most output is plain text: with no escape or carriage return there is
+    # nothing to strip or rewind, so skip the regex passes entirely.
+    if "\x1b" not in text and "\r" not in text:
+        return [l for l in text.split("\n") if l.strip()]
     text = _ANSI.sub("", text)
     text = text.replace("\r\n", "\n").replace("\r", "\n")
     return [l for l in _resolve_cursor_up(text) if l.strip()]
@@ -136,7 +202,9 @@ def normalize_chunk(chunk: bytes) -> list[str]:
 
 def write_include_file(outdir: str, samples: list[str]) -> str:
     """Write an --include file (one sample per line) and return its path."""
-    digest = hashlib.md5("\n".join(sorted(samples)).encode()).hexdigest()[:8]
+    # Only a short, stable name per sample set is needed — no crypto strength.
+    digest = hashlib.blake2b("\n".join(sorted(samples)).encode(),
+                             digest_size=4).hexdigest()
     fname = str(APP_STATE_DIR / f"include_{digest}.txt")
     APP_STATE_DIR.mkdir(parents=True, exist_ok=True)
     import pathlib
@@ -202,7 +270,7 @@ def nextflow_wf_cmd(
 
 def join_subcommands(labelled: list[tuple[str, str]]) -> str:
     """Join multiple tool commands with banners, optionally line-buffered."""
-    stdbuf = shutil.which("stdbuf")
+    stdbuf = which("stdbuf")
     parts: list[str] = []
     for banner, cmd in labelled:
         if stdbuf:
@@ -216,10 +284,15 @@ async def stream(
     work_dir: str = "",
     page: str = "",
     n_samples: int = 0,
+    spawn_cmd: str = "",
 ) -> None:
     """
     Run cmd as a background shell process, stream stdout/stderr to state.log.
 
+    `spawn_cmd`, when given, is the shell string actually executed; `cmd` is
+    still what history records and the UI shows (e.g. without a spawn-only
+    `exec`).
+
     Uses `async with state` to make state updates within the Reflex background
     event context. Replaces the per-namespace process in _PROCS so stop() can
     kill it. Persists a run record to history via core/history.py.
@@ -234,6 +307,7 @@ async def stream(
     )
     _hist.append_record(record)
     run_id = record["id"]
+    _notify()
 
     # Open the on-disk live log so any page (e.g. Runs) can tail this run.
     _LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -246,7 +320,7 @@ async def stream(
         state.run_id = run_id
 
     proc = await asyncio.create_subprocess_exec(
-        "bash", "-c", cmd,
+        "bash", "-c", spawn_cmd or cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         cwd=cwd,
@@ -267,13 +341,14 @@ async def stream(
     _hist.set_proc_info(run_id, proc.pid, pgid)
 
     def _persist(new_lines: list[str]) -> None:
-        for ln in new_lines:
-            log_fh.write(ln + "\n")
+        log_fh.writelines(ln + "\n" for ln in new_lines)
 
     # Coalesced UI updates: lines land on disk immediately (complete log) but are
     # pushed to Reflex state in batches, so a chatty Nextflow run doesn't trigger
     # one full-list re-serialization + websocket push per line (was O(n²)).
-    pending: list[str] = []
+    # Only the last MAX_LOG_LINES can ever reach the UI, so a burst larger than
+    # that just rotates through a bounded deque instead of growing a list.
+    pending: collections.deque[str] = collections.deque(maxlen=MAX_LOG_LINES)
     last_flush = time.monotonic()
 
     async def _flush(force: bool = False) -> None:
@@ -283,16 +358,20 @@ async def stream(
         if not force and len(pending) < FLUSH_LINES and \
                 (time.monotonic() - last_flush) < FLUSH_SECS:
             return
-        chunk, pending = pending, []
+        chunk, pending = pending, collections.deque(maxlen=MAX_LOG_LINES)
         last_flush = time.monotonic()
         async with state:
-            state.log = (state.log + chunk)[-MAX_LOG_LINES:]
+            log = state.log + list(chunk)
+            if len(log) > MAX_LOG_LINES:
+                log = log[-MAX_LOG_LINES:]
+            state.log = log
+        _notify(run_id)
 
     try:
         buf = b""
         while True:
             try:
-                chunk = await asyncio.wait_for(proc.stdout.read(4096),
+                chunk = await asyncio.wait_for(proc.stdout.read(READ_SIZE),
                                                timeout=FLUSH_SECS)
             except asyncio.TimeoutError:
                 # Process went quiet — push whatever is buffered so the UI never
@@ -302,9 +381,13 @@ async def stream(
             if not chunk:
                 break
             buf += chunk
-            while b"\n" in buf:
-                line_bytes, buf = buf.split(b"\n", 1)
-                lines = normalize_chunk(line_bytes + b"\n")
+            if b"\n" in buf:
+                # Split the read once and hand every complete line over as a
+                # single batch: one write to disk and one extend of pending,
+                # instead of a re-split of the remainder + write per line.
+                *complete, buf = buf.split(b"\n")
+                lines = [ln for raw in complete
+                         for ln in normalize_chunk(raw + b"\n")]
                 if lines:
                     _persist(lines)
                     pending.extend(lines)
@@ -329,6 +412,8 @@ async def stream(
         pass
     # Persist finish to history
     _hist.finish_record(run_id, rc)
+    _OUTPUT_SEQ.pop(run_id, None)
+    _notify()
     async with state:
         state.running = False
         state.status = "success" if rc == 0 else "failed"
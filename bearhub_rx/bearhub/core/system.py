@@ -1,13 +1,16 @@
 """Environment bootstrap and tool detection for BEAR-HUB."""
 from __future__ import annotations
 
+import functools
 import os
 import pathlib
 import re
 import shutil
 import signal
+import stat
 import subprocess
 import sys
+import time
 
 APP_STATE_DIR: pathlib.Path = pathlib.Path.home() / ".bactopia_ui_local"
 # install_bear.sh writes ~/.bear-hub/config.env — that is the authoritative
@@ -17,12 +20,28 @@ _INSTALLER_CONFIG: pathlib.Path = pathlib.Path.home() / ".bear-hub" / "config.en
 _CONFIG_DIR: pathlib.Path = APP_STATE_DIR
 _LEGACY_CONFIG: pathlib.Path = pathlib.Path.home() / ".bear-hub.env"
 _bactopia_version_cache: str | None = None
-
-# bearhub_rx/bearhub/core/ -> repo root (BEAR-HUB), where envs/ lives.
-_REPO_ROOT: pathlib.Path = pathlib.Path(__file__).resolve().parents[3]
-
-
+_bactopia_version_output: str | None = None
+# (expires_at, env key, prefix) — see _bactopia_env_prefix.
+_env_prefix_cache: tuple[float, tuple[str, str], pathlib.Path | None] | None = None
+_ENV_PREFIX_TTL = 60.0
+# monotonic() deadline while a reachable daemon is remembered, else None — see
+# docker_running.
+_docker_running_until: float | None = None
+_DOCKER_RUNNING_TTL = 30.0
+
+# bearhub_rx/bearhub/core/ -> repo root (BEAR-HUB), where envs/, VERSION and
+# the update scripts live. Derived once here; versions/updater import it.
+REPO_ROOT: pathlib.Path = pathlib.Path(__file__).resolve().parents[3]
+# Pre-joined once so the prefix probe doesn't rebuild Path objects per call.
+_REPO_BACTOPIA_ENV: str = os.path.join(str(REPO_ROOT), "envs", "bactopia")
+
+
+@functools.lru_cache(maxsize=32)
 def which(cmd: str) -> str | None:
+    """Memoized ``shutil.which`` — PATH doesn't change under a running app.
+
+    ``clear_tool_cache`` drops it when the user asks for a re-check.
+    """
     return shutil.which(cmd)
 
 
@@ -32,17 +51,40 @@ def _bactopia_env_prefix() -> pathlib.Path | None:
     Nothing in that env is ever on PATH, so every tool lookup has to go through
     the prefix. The repo-layout fallback keeps version detection working even
     when config.env is missing or wasn't loaded.
+
+    Every command preview resolves nextflow/bactopia through here, so the
+    answer is cached for a minute (keyed on the two env vars) instead of
+    stat()ing each candidate on every keystroke.
     """
+    global _env_prefix_cache
     prefix = os.environ.get("BACTOPIA_ENV_PREFIX", "").strip()
-    candidates = [pathlib.Path(prefix).expanduser()] if prefix else []
     root = os.environ.get("BEAR_HUB_ROOT", "").strip()
+    key = (prefix, root)
+    now = time.monotonic()
+    if _env_prefix_cache is not None:
+        expires, cached_key, cached = _env_prefix_cache
+        if cached_key == key and now < expires:
+            return cached
+    candidates = [os.path.expanduser(prefix)] if prefix else []
     if root:
-        candidates.append(pathlib.Path(root).expanduser() / "envs" / "bactopia")
-    candidates.append(_REPO_ROOT / "envs" / "bactopia")
+        candidates.append(os.path.join(os.path.expanduser(root), "envs", "bactopia"))
+    candidates.append(_REPO_BACTOPIA_ENV)
+    found = None
     for cand in candidates:
-        if (cand / "bin").is_dir():
-            return cand
-    return None
+        if os.path.isdir(os.path.join(cand, "bin")):
+            found = pathlib.Path(cand)
+            break
+    _env_prefix_cache = (now + _ENV_PREFIX_TTL, key, found)
+    return found
+
+
+def _is_executable(path: str | os.PathLike) -> bool:
+    """Regular file with an execute bit — one ``stat`` instead of is_file + access."""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return False
+    return stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o111)
 
 
 def get_env_bin(name: str) -> str:
@@ -55,7 +97,7 @@ def get_env_bin(name: str) -> str:
     prefix = _bactopia_env_prefix()
     if prefix:
         cand = prefix / "bin" / name
-        if cand.is_file() and os.access(cand, os.X_OK):
+        if _is_executable(cand):
             return str(cand)
     return which(name) or name
 
@@ -65,7 +107,7 @@ def get_nextflow_bin() -> str:
     explicit = os.environ.get("NEXTFLOW_BIN", "").strip()
     if explicit:
         p = pathlib.Path(explicit).expanduser().resolve()
-        if p.is_file() and os.access(p, os.X_OK):
+        if _is_executable(p):
             return str(p)
     return get_env_bin("nextflow")
 
@@ -75,14 +117,37 @@ def get_bactopia_bin() -> str:
     explicit = os.environ.get("BACTOPIA_BIN", "").strip()
     if explicit:
         p = pathlib.Path(explicit).expanduser().resolve()
-        if p.is_file() and os.access(p, os.X_OK):
+        if _is_executable(p):
             return str(p)
     return get_env_bin("bactopia")
 
 
 def nextflow_available() -> bool:
     nf = get_nextflow_bin()
-    return bool(which(nf) or (pathlib.Path(nf).is_file() and os.access(nf, os.X_OK)))
+    # get_nextflow_bin() hands back an absolute path whenever it found one, so
+    # stat that directly and only fall back to a PATH search for a bare name.
+    if os.sep in nf:
+        return _is_executable(nf)
+    return bool(which(nf))
+
+
+def bactopia_version_output() -> str:
+    """Raw ``bactopia --version`` output, probed once per process.
+
+    The CLI boots a whole Python env just to print its version, so both the
+    run-pinning below and the Status page share this single probe.
+    """
+    global _bactopia_version_output
+    if _bactopia_version_output is None:
+        try:
+            r = subprocess.run(
+                [get_bactopia_bin(), "--version"],
+                capture_output=True, text=True, timeout=15,
+            )
+            _bactopia_version_output = (r.stdout + r.stderr).strip()
+        except (OSError, subprocess.SubprocessError):
+            _bactopia_version_output = ""
+    return _bactopia_version_output
 
 
 def get_bactopia_version() -> str | None:
@@ -99,19 +164,9 @@ def get_bactopia_version() -> str | None:
     global _bactopia_version_cache
     if _bactopia_version_cache is not None:
         return _bactopia_version_cache
-    try:
-        r = subprocess.run(
-            [get_bactopia_bin(), "--version"],
-            capture_output=True, text=True, timeout=15,
-        )
-        m = re.search(r"bactopia\s+v?(\d+\.\d+\.\d+)", r.stdout + r.stderr,
-                      re.IGNORECASE)
-        if m:
-            _bactopia_version_cache = m.group(1)
-            return _bactopia_version_cache
-    except OSError:
-        pass
-    _bactopia_version_cache = "4.0.0"
+    m = re.search(r"bactopia\s+v?(\d+\.\d+\.\d+)", bactopia_version_output(),
+                  re.IGNORECASE)
+    _bactopia_version_cache = m.group(1) if m else "4.0.0"
     return _bactopia_version_cache
 
 
@@ -124,17 +179,64 @@ def docker_running() -> bool:
 
     BEAR-HUB runs Bactopia with `-profile docker`, so a stopped daemon makes
     every run fail with a cryptic error. `docker info` is the cheap probe.
+
+    A reachable daemon is remembered for 30s so hopping between pages doesn't
+    fork a fresh `docker info` each time. A failure is never cached, so starting
+    Docker is picked up on the next page load; clear_tool_cache forces a re-probe.
     """
-    if not which("docker"):
-        return False
-    try:
-        r = subprocess.run(
-            ["docker", "info"],
-            capture_output=True, text=True, timeout=8,
-        )
-        return r.returncode == 0
-    except OSError:
-        return False
+    global _docker_running_until
+    now = time.monotonic()
+    if _docker_running_until is not None and now < _docker_running_until:
+        return True
+    ok = False
+    if which("docker"):
+        try:
+            r = subprocess.run(
+                ["docker", "info"],
+                capture_output=True, text=True, timeout=8,
+            )
+            ok = r.returncode == 0
+        except OSError:
+            pass
+    _docker_running_until = now + _DOCKER_RUNNING_TTL if ok else None
+    return ok
+
+
+def clear_tool_cache() -> None:
+    """Forget memoized tool lookups so a fresh install/PATH change is picked up.
+
+    Called from the Status page's Refresh button, the one place a user asks the
+    app to re-detect what's installed; a plain page load keeps the caches.
+    """
+    global _bactopia_version_cache, _bactopia_version_output, _env_prefix_cache
+    global _docker_running_until
+    which.cache_clear()
+    _bactopia_version_cache = None
+    _bactopia_version_output = None
+    _env_prefix_cache = None
+    _docker_running_until = None
+
+
+def read_tail(path: str | os.PathLike, n: int, block: int = 1 << 16) -> list[str]:
+    """Last `n` lines of a text file, reading back from EOF only as far as needed.
+
+    Run and update logs grow for as long as the job runs, so tailing them
+    shouldn't mean reading (and decoding) the whole file every refresh.
+    Raises OSError like open().
+    """
+    with open(path, "rb") as fh:
+        pos = fh.seek(0, os.SEEK_END)
+        data, newlines = b"", 0
+        while pos > 0 and (n <= 0 or newlines <= n):
+            step = min(block, pos)
+            pos -= step
+            fh.seek(pos)
+            chunk = fh.read(step)
+            newlines += chunk.count(b"\n")
+            data = chunk + data
+    if pos > 0:
+        data = data[data.index(b"\n") + 1:]   # drop the partial first line
+    return data.decode("utf-8", errors="replace").splitlines()[-n:]
 
 
 def get_default_outdir() -> str:
@@ -210,6 +312,9 @@ def shutdown() -> None:
             os._exit(0)
 
 
+_EXPORT_RE = re.compile(r"^export\s+([A-Za-z_][A-Za-z0-9_]*)=(.*)")
+
+
 def bootstrap_env() -> None:
     """Load env vars from the BEAR-HUB config file, if present."""
     candidates: list[pathlib.Path] = [
@@ -223,9 +328,10 @@ def bootstrap_env() -> None:
             continue
         for line in p.read_text(encoding="utf-8").splitlines():
             line = line.strip()
-            if not line or line.startswith("#"):
+            # Only `export NAME=value` lines matter; skip the rest before regex.
+            if not line.startswith("export"):
                 continue
-            m = re.match(r"^export\s+([A-Za-z_][A-Za-z0-9_]*)=(.*)", line)
+            m = _EXPORT_RE.match(line)
             if m:
                 var, value = m.group(1), m.group(2).strip().strip('"').strip("'")
                 os.environ.setdefault(var, value)
@@ -32,10 +32,7 @@ import pathlib
 import shlex
 import subprocess
 
-from bearhub.core.system import APP_STATE_DIR
-
-# bearhub_rx/bearhub/core/updater.py -> repo root (same derivation as versions.py)
-REPO_ROOT: pathlib.Path = pathlib.Path(__file__).resolve().parents[3]
+from bearhub.core.system import APP_STATE_DIR, REPO_ROOT, read_tail
 
 _LOG = APP_STATE_DIR / "update.log"
 _MARKER = APP_STATE_DIR / "update.running"
@@ -86,7 +83,7 @@ def is_running() -> bool:
 def tail_log(n: int = 400) -> list[str]:
     """Last `n` lines of the most recent update log ([] if never updated)."""
     try:
-        return _LOG.read_text(encoding="utf-8", errors="replace").splitlines()[-n:]
+        return read_tail(_LOG, n)
     except OSError:
         return []
 
@@ -1,17 +1,30 @@
 """Detect installed tool versions for the Status page."""
 from __future__ import annotations
 
-import json
-import pathlib
+import os
 import re
 import subprocess
-import urllib.request
-
-from bearhub.core.system import get_bactopia_bin, get_env_bin, get_nextflow_bin
+from concurrent.futures import ThreadPoolExecutor
+
+from bearhub.core.system import (
+    REPO_ROOT,
+    bactopia_version_output,
+    docker_running,
+    get_env_bin,
+    get_nextflow_bin,
+    which,
+)
 from bearhub.data.catalog import GITHUB_REPO
 
-# bearhub_rx/bearhub/core/ -> repo root (BEAR-HUB), where the VERSION file lives.
-_REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+
+_DIGITS_RE = re.compile(r"\d+")
+_NF_VERSION_RE = re.compile(r"version\s+([\d.]+(?:\.[\w]+)?)", re.IGNORECASE)
+_BACTOPIA_VERSION_RE = re.compile(r"bactopia\s+v?([\d.]+)", re.IGNORECASE)
+# Capture the whole quoted string: conda JDKs report builds like
+# "23.0.2-internal", which a digits-only pattern silently misses.
+_JAVA_VERSION_RE = re.compile(r'version\s+"([^"]+)"')
+_DOCKER_VERSION_RE = re.compile(r"Docker version\s+([\d.]+)", re.IGNORECASE)
+_JAVA_RELEASE_RE = re.compile(r'^JAVA_VERSION="([^"]+)"', re.MULTILINE)
 
 
 def _run(args: list[str]) -> str:
@@ -29,14 +42,14 @@ def _normalize(tag: str) -> str:
 
 def _version_tuple(tag: str) -> tuple[int, ...]:
     """Best-effort numeric tuple for comparing semver-ish tags."""
-    parts = re.findall(r"\d+", _normalize(tag))
+    parts = _DIGITS_RE.findall(_normalize(tag))
     return tuple(int(p) for p in parts) if parts else (0,)
 
 
 def get_app_version() -> str:
     """Read the BEAR-HUB app version from the repo VERSION file (e.g. 'v2.0.0')."""
     try:
-        return (_REPO_ROOT / "VERSION").read_text().strip() or "unknown"
+        return (REPO_ROOT / "VERSION").read_text().strip() or "unknown"
     except OSError:
         return "unknown"
 
@@ -48,6 +61,11 @@ def check_for_update(timeout: float = 4.0) -> dict[str, str]:
     "unknown". All network/parse errors are swallowed (offline labs must never
     see an error) and reported as "unknown".
     """
+    # Imported here: urllib.request drags in http.client/ssl/email, and this
+    # check only runs when the Status page asks for it.
+    import json
+    import urllib.request
+
     current = get_app_version()
     result = {"current": current, "latest": "", "available": "unknown"}
     url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
@@ -57,7 +75,7 @@ def check_for_update(timeout: float = 4.0) -> dict[str, str]:
                           "User-Agent": "BEAR-HUB-update-check"}
         )
         with urllib.request.urlopen(req, timeout=timeout) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
+            data = json.load(resp)  # decodes straight from the stream
         latest = str(data.get("tag_name") or "").strip()
     except Exception:
         return result  # offline / no releases / API error → "unknown"
@@ -73,34 +91,58 @@ def check_for_update(timeout: float = 4.0) -> dict[str, str]:
     return result
 
 
+def _java_version_output(java_bin: str) -> str:
+    """Java version text, from the JDK's ``release`` file when possible.
+
+    ``java -version`` boots a whole JVM just to print a string; every JDK
+    (conda's included) ships ``$JAVA_HOME/release`` with the same version, so
+    read that and only launch the JVM when it's missing. The result is shaped
+    like ``java -version`` output so one regex parses either source.
+    """
+    # A bare "java" (PATH fallback) must be looked up on PATH, not resolved
+    # against the cwd; if it can't be found there's no JDK home to read.
+    path = which(java_bin)
+    if path:
+        try:
+            home = os.path.dirname(os.path.dirname(os.path.realpath(path)))
+            with open(os.path.join(home, "release"), encoding="utf-8") as fh:
+                m = _JAVA_RELEASE_RE.search(fh.read())
+            if m:
+                return f'version "{m.group(1)}"'
+        except OSError:
+            pass
+    return _run([java_bin, "-version"])
+
+
 def get_versions() -> dict[str, str]:
     out: dict[str, str] = {}
 
-    nf = get_nextflow_bin()
-    nf_out = _run([nf, "-version"])
-    m = re.search(r"version\s+([\d.]+(?:\.[\w]+)?)", nf_out, re.IGNORECASE)
+    # Each probe is an independent subprocess (the JVM ones take ~1s cold), so
+    # run them side by side rather than paying the sum of their latencies.
+    with ThreadPoolExecutor(max_workers=5) as ex:
+        f_nf = ex.submit(_run, [get_nextflow_bin(), "-version"])
+        f_bac = ex.submit(bactopia_version_output)
+        # The env's Java is the one Nextflow runs on; the distro's (often older)
+        # Java on PATH would be reported as a false negative against the 17+ floor.
+        f_java = ex.submit(_java_version_output, get_env_bin("java"))
+        f_docker = ex.submit(_run, ["docker", "--version"])
+        f_daemon = ex.submit(docker_running)
+
+    m = _NF_VERSION_RE.search(f_nf.result())
     out["nextflow"] = m.group(1) if m else "unknown"
 
-    bac_out = _run([get_bactopia_bin(), "--version"])
-    m = re.search(r"bactopia\s+v?([\d.]+)", bac_out, re.IGNORECASE)
+    m = _BACTOPIA_VERSION_RE.search(f_bac.result())
     out["bactopia"] = m.group(1) if m else "unknown"
 
-    # The env's Java is the one Nextflow runs on; the distro's (often older)
-    # Java on PATH would be reported as a false negative against the 17+ floor.
-    java_out = _run([get_env_bin("java"), "-version"])
-    # Capture the whole quoted string: conda JDKs report builds like
-    # "23.0.2-internal", which a digits-only pattern silently misses.
-    m = re.search(r'version\s+"([^"]+)"', java_out)
+    m = _JAVA_VERSION_RE.search(f_java.result())
     out["java"] = m.group(1) if m else "unknown"
 
-    docker_out = _run(["docker", "--version"])
-    m = re.search(r"Docker version\s+([\d.]+)", docker_out, re.IGNORECASE)
+    m = _DOCKER_VERSION_RE.search(f_docker.result())
     ver = m.group(1) if m else "unknown"
     # Distinguish "installed" from "daemon running" — a stopped daemon breaks runs.
-    from bearhub.core.system import docker_running
     if ver == "unknown":
         out["docker"] = "not installed"
-    elif docker_running():
+    elif f_daemon.result():
         out["docker"] = f"{ver} (running)"
     else:
         out["docker"] = f"{ver} (daemon NOT running)"
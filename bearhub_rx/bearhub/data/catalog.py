@@ -13,8 +13,9 @@ import importlib.util
 import json
 import pathlib
 
+from bearhub.core.system import REPO_ROOT
+
 _HERE = pathlib.Path(__file__).resolve().parent
-_REPO_ROOT = _HERE.parents[2]  # bearhub_rx/bearhub/data/ -> repo root (BEAR-HUB)
 
 BACTOPIA_VERSION = "4.0.0"
 PROFILES = ["docker", "singularity", "standard"]
@@ -33,7 +34,7 @@ def _load_static():
     except Exception:
         pass
     try:
-        data_py = _REPO_ROOT / "utils" / "data.py"
+        data_py = REPO_ROOT / "utils" / "data.py"
         spec = importlib.util.spec_from_file_location("_bactopia_data", data_py)
         mod = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(mod)  # type: ignore[union-attr]
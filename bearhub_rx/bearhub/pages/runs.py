@@ -28,6 +28,11 @@ def _live_log_panel() -> rx.Component:
                 ),
             ),
             wzmod.copy_button(RunsState.selected_log_text, "Copy log"),
+            rx.button(
+                rx.icon("download", size=14), "Full log",
+                on_click=RunsState.download_log,
+                variant="soft", color_scheme="gray", size="1",
+            ),
             width="100%", align="center",
         ),
         rx.cond(
@@ -268,7 +268,7 @@ def status_page() -> rx.Component:
                 rx.button(
                     rx.icon("refresh-cw", size=16),
                     "Refresh",
-                    on_click=StatusState.load,
+                    on_click=StatusState.refresh,
                     variant="soft",
                     size="2",
                 ),
@@ -9,10 +9,12 @@ and a background `run` event that builds the command and streams output.
 from __future__ import annotations
 
 import asyncio
+import functools
 import json as _json
 import os
 import pathlib
 import shlex
+import time
 from shlex import quote as _q, split as _split
 
 import reflex as rx
@@ -660,15 +662,27 @@ def _numt(v: str) -> bool:
         return bool(str(v).strip())
 
 
+# Plain on/off fastp switches (bflag key, fastp flag), in emission order.
+_FASTP_TRIM_FLAGS: tuple[tuple[str, str], ...] = (
+    ("fastp_dash3",     "-3"),
+    ("fastp_5prime",    "-5"),
+    ("fastp_cut_right", "-r"),
+)
+_FASTP_FILTER_FLAGS: tuple[tuple[str, str], ...] = (
+    ("fastp_dedup",             "-D"),
+    ("fastp_correction",        "-c"),
+    ("fastp_poly_g",            "-g"),
+    ("fastp_poly_x",            "-x"),
+    ("fastp_detect_adapter_pe", "--detect_adapter_for_pe"),
+)
+
+
 def _fastp_opts(o: dict, f: dict) -> str:
     """Build the --fastp_opts string from bopts/bflags."""
     mode = o.get("fastp_mode", "Simple")
     if mode.startswith("Advanced"):
         return o.get("fastp_raw", "").strip()
-    p: list[str] = []
-    if f.get("fastp_dash3"):    p.append("-3")
-    if f.get("fastp_5prime"):   p.append("-5")
-    if f.get("fastp_cut_right"): p.append("-r")
+    p: list[str] = [flag for key, flag in _FASTP_TRIM_FLAGS if f.get(key)]
     p += ["-M", o.get("fastp_M", "20")]
     p += ["-W", o.get("fastp_W", "5")]
     if f.get("fastp_q_enable"):
@@ -679,12 +693,7 @@ def _fastp_opts(o: dict, f: dict) -> str:
         p += ["-n", o["fastp_n"]]
     if _numt(o.get("fastp_u", "0")):
         p += ["-u", o["fastp_u"]]
-    if f.get("fastp_dedup"):       p.append("-D")
-    if f.get("fastp_correction"):  p.append("-c")
-    if f.get("fastp_poly_g"):      p.append("-g")
-    if f.get("fastp_poly_x"):      p.append("-x")
-    if f.get("fastp_detect_adapter_pe"):
-        p.append("--detect_adapter_for_pe")
+    p += [flag for key, flag in _FASTP_FILTER_FLAGS if f.get(key)]
     r1 = o.get("fastp_adapter_r1", "").strip()
     r2 = o.get("fastp_adapter_r2", "").strip()
     # No inner _q here: the whole --fastp_opts value is shell-quoted as one arg
@@ -946,10 +955,27 @@ def main_cmd_groups(outdir: str, fofn_path: str, o: dict, f: dict,
     Returns ``[(key, label, tokens), …]`` with empty groups dropped. Concatenating
     the tokens in order (and shell-quoting) reproduces the exact command that
     ``_main_cmd`` runs — this function is the single source of truth for both.
+
+    Both command previews recompute on every wizard keystroke, so the build is
+    memoized on its inputs. nextflow/bactopia and the resolved outdir are worked
+    out here (the tools each cached in system) and are part of the key, so a
+    reinstall or a re-pointed symlink still shows up; the cached build is pure.
     """
-    nf = system.get_nextflow_bin()
-    ver = system.get_bactopia_version()
     outp = str(_pathlib.Path(outdir).expanduser().resolve())
+    groups = _main_cmd_groups(
+        system.get_nextflow_bin(), system.get_bactopia_version(),
+        outdir, outp, fofn_path, tuple(sorted(o.items())), tuple(sorted(f.items())),
+        threads, memory, resume, profile,
+    )
+    return [(k, lbl, list(toks)) for k, lbl, toks in groups]
+
+
+@functools.lru_cache(maxsize=64)
+def _main_cmd_groups(nf: str, ver: str | None, outdir: str, outp: str,
+                     fofn_path: str, o_items: tuple, f_items: tuple,
+                     threads: int, memory: int, resume: bool,
+                     profile: str) -> tuple[tuple[str, str, tuple[str, ...]], ...]:
+    o, f = dict(o_items), dict(f_items)
     jp = _json_params(o)
 
     base: list[str] = [nf, "run", "bactopia/bactopia"]
@@ -1008,16 +1034,19 @@ def main_cmd_groups(outdir: str, fofn_path: str, o: dict, f: dict,
 
     by_key = {"base": base, "step_input": inp, "step_cleaning": clean,
               "step_assembler": asm, "step_typing": typ, "step_extras": extras}
-    return [(k, lbl, by_key[k]) for k, lbl in _CMD_GROUP_LABELS if by_key[k]]
+    return tuple((k, lbl, tuple(by_key[k])) for k, lbl in _CMD_GROUP_LABELS
+                 if by_key[k])
 
 
 def _main_cmd(outdir: str, fofn_path: str, o: dict, f: dict,
                threads: int, memory: int, resume: bool,
-               preview: bool = False, profile: str = "docker") -> str:
+               preview: bool = False, profile: str = "docker",
+               exec_nf: bool = False) -> str:
     """Build the full Nextflow command for the main Bactopia pipeline.
 
     Assembled from main_cmd_groups() so the preview/builder can never drift from
-    the executed command.
+    the executed command. `exec_nf` gives the form actually spawned by the
+    runner (see BactopiaState._build).
     """
     tokens = [t for _k, _l, toks in
               main_cmd_groups(outdir, fofn_path, o, f, threads, memory, resume, profile)
@@ -1030,7 +1059,12 @@ def _main_cmd(outdir: str, fofn_path: str, o: dict, f: dict,
             kv = ", ".join(f"{k}={v}" for k, v in jp.items())
             return f"# {_PARAMS_FILE}: {{{kv}}}\n{nf_cmd}"
         return nf_cmd
-    return f"cd {_q(str(_pathlib.Path(outdir).expanduser().resolve()))} && {nf_cmd}"
+    cd = f"cd {_q(str(_pathlib.Path(outdir).expanduser().resolve()))} && "
+    # exec: bash hands its PID to Nextflow instead of idling as a parent, so
+    # one fewer process per run and stop() signals Nextflow directly. Spawned
+    # form only — the recorded/copyable command must not carry it, or pasting
+    # it into a terminal would replace the user's login shell.
+    return f"{cd}exec {nf_cmd}" if exec_nf else f"{cd}{nf_cmd}"
 
 
 # ── BactopiaState ──────────────────────────────────────────────────────────────
@@ -1072,8 +1106,13 @@ class BactopiaState(WizardMixin, rx.State):
         if not data:
             yield rx.toast.error(f"Preset '{name}' not found.")
             return
-        bopts = dict(DEFAULT_BOPTS); bopts.update(data.get("bopts", {}))
-        bflags = dict(DEFAULT_BFLAGS); bflags.update(data.get("bflags", {}))
+        # Apply only keys the current form knows: presets saved by an older
+        # release may carry renamed/removed options that nothing would read.
+        saved_o, saved_f = data.get("bopts", {}), data.get("bflags", {})
+        bopts = dict(DEFAULT_BOPTS)
+        bopts.update({k: saved_o[k] for k in DEFAULT_BOPTS.keys() & saved_o.keys()})
+        bflags = dict(DEFAULT_BFLAGS)
+        bflags.update({k: saved_f[k] for k in DEFAULT_BFLAGS.keys() & saved_f.keys()})
         self.bopts = bopts
         self.bflags = bflags
         self.preset_name = name
@@ -1218,39 +1257,43 @@ class BactopiaState(WizardMixin, rx.State):
         return out
 
     def _build(self):
+        """Return (cmd, spawn, err): the recorded command, the exec form the
+        runner spawns, and a user-facing error ("" when ready)."""
         if not system.nextflow_available():
-            return ("", "Nextflow not found (PATH / BACTOPIA_ENV_PREFIX / NEXTFLOW_BIN).")
+            return ("", "", "Nextflow not found (PATH / BACTOPIA_ENV_PREFIX / NEXTFLOW_BIN).")
         if not self.outdir.strip():
-            return ("", "Choose an output directory.")
+            return ("", "", "Choose an output directory.")
         outdir = bactopia.safe_dir(self.outdir)
         _pathlib.Path(outdir).mkdir(parents=True, exist_ok=True)
         fofn_out = str(_pathlib.Path(outdir) / "samples.txt")
         if not _pathlib.Path(fofn_out).is_file():
-            return ("", "Generate the FOFN first (Scan & build FOFN).")
+            return ("", "", "Generate the FOFN first (Scan & build FOFN).")
         if not bakta_ready(self.bopts, self.bflags):
-            return ("", "Bakta requires --bakta_db. Point it at a local Bakta DB, or "
-                        "set it to a destination path and tick --download_bakta to "
-                        "fetch one there. Without it the run would silently annotate "
-                        "with Prokka instead.")
+            return ("", "", "Bakta requires --bakta_db. Point it at a local Bakta DB, or "
+                            "set it to a destination path and tick --download_bakta to "
+                            "fetch one there. Without it the run would silently annotate "
+                            "with Prokka instead.")
         # Write the -params-file JSON for float params (if any user-set).
         jp = _json_params(self.bopts)
         if jp:
             (_pathlib.Path(outdir) / _PARAMS_FILE).write_text(
                 _json.dumps(jp, indent=2), encoding="utf-8")
-        cmd = _main_cmd(outdir, fofn_out, self.bopts, self.bflags,
-                         int(self.threads or 0), int(self.memory or 0),
-                         bool(self.resume), preview=False, profile=self.profile)
-        return (cmd, "")
+        args = (outdir, fofn_out, self.bopts, self.bflags,
+                int(self.threads or 0), int(self.memory or 0), bool(self.resume))
+        cmd = _main_cmd(*args, profile=self.profile)
+        spawn = _main_cmd(*args, profile=self.profile, exec_nf=True)
+        return (cmd, spawn, "")
 
     @rx.event(background=True)
     async def run(self):
         async with self:
-            cmd, err = self._build()
+            cmd, spawn, err = self._build()
         if err:
             yield rx.toast.error(err)
             return
         await runner.stream(
             self, cmd, "bactopia",
+            spawn_cmd=spawn,
             work_dir=bactopia.safe_dir(self.outdir),
             page="Bactopia",
             n_samples=self.n_selected,
@@ -1273,6 +1316,12 @@ class BactopiaState(WizardMixin, rx.State):
 from bearhub.core import history as _history
 
 
+# Runs monitor pacing (seconds): at most one refresh per MIN_GAP, and a
+# fallback poll every POLL for adopted orphans, which don't signal activity.
+_MONITOR_MIN_GAP = 2.0
+_MONITOR_POLL = 5.0
+
+
 class RunsState(rx.State):
     """Runs page state: history list + live monitor of any active run."""
     records: list[dict] = []
@@ -1310,6 +1359,22 @@ class RunsState(rx.State):
                 break
         self.selected_log = runner.tail_run_log(run_id)
 
+    def download_log(self):
+        """Download the selected run's complete on-disk log.
+
+        The panel only holds the last MAX_LOG_LINES lines; this is the full file.
+        It is streamed by the backend's RUN_LOG_ROUTE, never loaded into state.
+        """
+        rid = self.selected_id
+        if not rid:
+            return
+        if runner.run_log_file(rid) is None:
+            return rx.toast.error("No log on disk for this run.")
+        return rx.download(
+            url=f"{rx.config.get_config().api_url}{runner.RUN_LOG_ROUTE}/{rid}",
+            filename=f"{rid}.log",
+        )
+
     def clear_selected(self):
         self.selected_id = ""
         self.selected_cmd = ""
@@ -1330,7 +1395,7 @@ class RunsState(rx.State):
 
     @rx.event(background=True)
     async def monitor(self):
-        """Poll history + the selected run's on-disk log while anything is active.
+        """Refresh history + the selected run's on-disk log while anything is active.
 
         Self-terminates when no run is active, so it isn't an always-on loop.
         Restart it via Refresh or by selecting a run.
@@ -1339,17 +1404,34 @@ class RunsState(rx.State):
             if self.monitoring:
                 return  # already polling
             self.monitoring = True
+        seen_hist = seen_log = None
         try:
             while True:
                 async with self:
-                    self._reload()
+                    # Re-read each file only when it actually changed since the
+                    # last pass — a quiet run costs two stat()s a tick, and new
+                    # log output doesn't re-send the whole history list.
+                    hist_sig = _history.signature()
+                    if hist_sig != seen_hist:
+                        seen_hist = hist_sig
+                        self._reload()
                     sel = self.selected_id
-                    if sel:
-                        self.selected_log = runner.tail_run_log(sel)
+                    log_sig = (sel, runner.log_signature(sel)) if sel else None
+                    if log_sig != seen_log:
+                        seen_log = log_sig
+                        if sel:
+                            self.selected_log = runner.tail_run_log(sel)
                     active = self.active_count > 0 or len(runner.active_run_ids()) > 0
                 if not active:
                     break
-                await asyncio.sleep(2)
+                # Sleep until the selected run writes output or a run starts/
+                # finishes (the fallback timeout covers adopted orphans, which
+                # don't signal), but never refresh more than once per
+                # _MONITOR_MIN_GAP — output of unrelated runs doesn't wake us.
+                last = time.monotonic()
+                if await runner.wait_activity(sel, timeout=_MONITOR_POLL):
+                    await asyncio.sleep(
+                        max(0.0, last + _MONITOR_MIN_GAP - time.monotonic()))
         finally:
             async with self:
                 self.monitoring = False
@@ -1392,6 +1474,15 @@ class StatusState(rx.State):
     active_runs: int = 0            # snapshot when the dialog opens (warn the user)
     update_log: list[str] = []
 
+    @rx.event
+    def refresh(self):
+        """Refresh button: forget cached tool lookups, then re-detect.
+
+        A plain page load reuses the caches; only this re-runs every probe.
+        """
+        system.clear_tool_cache()
+        return StatusState.load
+
     @rx.event(background=True)
     async def load(self):
         from bearhub.core import versions, updater
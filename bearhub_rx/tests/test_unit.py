@@ -39,6 +39,16 @@ check("get_default_outdir() → str",  isinstance(get_default_outdir(), str))
 check("nextflow_available() → bool", isinstance(nextflow_available(), bool))
 check("docker_available() → bool",   isinstance(docker_available(), bool))
 
+# read_tail seeks back from EOF; it must agree with a full read + splitlines.
+from bearhub.core.system import read_tail
+with tempfile.TemporaryDirectory() as _td:
+    _log = os.path.join(_td, "run.log")
+    _lines = [f"line {i} é" for i in range(5000)]
+    pathlib.Path(_log).write_text("\n".join(_lines) + "\n", encoding="utf-8")
+    check("read_tail: last n lines",      read_tail(_log, 10) == _lines[-10:])
+    check("read_tail: small blocks",      read_tail(_log, 300, block=7) == _lines[-300:])
+    check("read_tail: n > file lines",    read_tail(_log, 10**6) == _lines)
+
 # ── 2. core/bactopia ───────────────────────────────────────────────────────
 section("2. core/bactopia")
 from bearhub.core.bactopia import safe_dir, list_subdirs, discover_samples, guess_root_default
@@ -108,6 +118,23 @@ with tempfile.TemporaryDirectory() as d:
     check("short_polish strategy → runtype=short_polish",
           any(r[0]=="sampleA" and r[1]=="short_polish" for r in rows2))
 
+# Discovery must not descend into a Nextflow launch dir's work/ (staged input
+# copies), VCS folders or a nested bactopia_out/; a plain folder that happens to
+# be named work/ is fine, even next to a *file* called .nextflow.
+with tempfile.TemporaryDirectory() as td:
+    base = pathlib.Path(td)
+    for rel in ("run/.nextflow/history", "run/work/ab/cdef/sampleC.fastq.gz",
+                ".git/sampleD.fastq.gz", "work/sampleE.fastq.gz",
+                "bactopia_out/sampleG/main/qc/sampleG.fastq.gz",
+                "other/.nextflow", "other/work/sampleF.fastq.gz"):
+        (base / rel).parent.mkdir(parents=True, exist_ok=True)
+        (base / rel).touch()
+    fofn3 = str(base / "s3.txt")
+    build_fofn(str(base), fofn_path=fofn3)
+    names3 = {r.split("\t")[0] for r in pathlib.Path(fofn3).read_text().splitlines()[1:] if r}
+    check("discovery skips Nextflow work/, .git and bactopia_out/",
+          names3 == {"sampleE", "sampleF"})
+
 # ── 4. core/history ────────────────────────────────────────────────────────
 section("4. core/history — persistence")
 from bearhub.core import history as h
@@ -152,6 +179,19 @@ finally:
     h._HISTORY_FILE.unlink(missing_ok=True)
     h._HISTORY_FILE = orig_file
 
+# run logs served for download
+from bearhub.core import runner as _runner
+orig_log_dir = _runner._LOG_DIR
+with tempfile.TemporaryDirectory() as _d:
+    _runner._LOG_DIR = pathlib.Path(_d)
+    try:
+        (pathlib.Path(_d) / "abcd1234.log").write_text("line\n")
+        check("run_log_file: existing log",   _runner.run_log_file("abcd1234") == f"{_d}/abcd1234.log")
+        check("run_log_file: missing → None", _runner.run_log_file("ffff0000") is None)
+        check("run_log_file: refuses paths",  _runner.run_log_file("../abcd1234") is None)
+    finally:
+        _runner._LOG_DIR = orig_log_dir
+
 # ── 5. state — defaults & command builder ─────────────────────────────────
 section("5. state — DEFAULT_BOPTS / DEFAULT_BFLAGS / command builder")
 from bearhub.state import DEFAULT_BOPTS, DEFAULT_BFLAGS, _assembler_flags, _fastp_opts, _main_cmd
@@ -39,6 +39,33 @@ BACTOPIA_PREFIX="${ENVS_DIR}/bactopia"
 # Conda/mamba binaries (populated by check_prerequisites)
 MAMBA_BIN=""
 CONDA_BIN=""
+# The one binary every create/install goes through: mamba when present (much
+# faster solver), else conda. Resolved once by check_prerequisites.
+SOLVER=""
+# PID (= process group) of the background Reflex frontend pre-compile, and its
+# log (see setup_bear_hub_env)
+PRECOMPILE_PID=""
+PRECOMPILE_LOG="${CONFIG_DIR}/precompile.log"
+
+# Solver options for every create/install below. --override-channels ignores
+# whatever channels the user's ~/.condarc lists (e.g. defaults), and strict
+# priority stops the solver from weighing every build across channels — most
+# of the install time is solving, not downloading.
+CHANNEL_OPTS=(--override-channels --strict-channel-priority)
+export MAMBA_NO_BANNER=1
+
+# Take down the background pre-compile (and its node/bun children) if the
+# installer exits early — Ctrl-C or a `set -e` abort would otherwise leave it
+# orphaned, still writing into bearhub_rx/.web.
+_kill_precompile() {
+    if [[ -n "${PRECOMPILE_PID}" ]]; then
+        kill -- -"${PRECOMPILE_PID}" 2>/dev/null || true
+        PRECOMPILE_PID=""
+    fi
+}
+trap _kill_precompile EXIT
+trap '_kill_precompile; exit 130' INT
+trap '_kill_precompile; exit 143' TERM
 
 # ── Parse arguments ───────────────────────────────────────────────────────────
 while [[ $# -gt 0 ]]; do
@@ -122,6 +149,7 @@ EOF
     fi
     [[ -n "${MAMBA_BIN}" ]] && echo "mamba: ${MAMBA_BIN}"
     [[ -n "${CONDA_BIN}" ]] && echo "conda: ${CONDA_BIN}"
+    SOLVER="${MAMBA_BIN:-${CONDA_BIN}}"
 }
 
 # Detect conda/mamba on PATH, or source one from a common install prefix.
@@ -208,13 +236,8 @@ setup_bear_hub_env() {
         echo "Ambiente 'bear-hub' ja existe em: ${BEAR_PREFIX}"
     else
         echo "Criando ambiente 'bear-hub' em ${BEAR_PREFIX}..."
-        if [[ -n "${MAMBA_BIN}" ]]; then
-            "${MAMBA_BIN}" create -y -p "${BEAR_PREFIX}" -c conda-forge \
-                python=3.11 websockets pyyaml
-        else
-            "${CONDA_BIN}" create -y -p "${BEAR_PREFIX}" -c conda-forge \
-                python=3.11 websockets pyyaml
-        fi
+        "${SOLVER}" create -y -p "${BEAR_PREFIX}" "${CHANNEL_OPTS[@]}" -c conda-forge \
+            python=3.11 websockets pyyaml
     fi
     # Ensure Reflex is present and pinned — ALWAYS (idempotent). This fixes
     # partial installs where the env exists but Reflex is missing, and lets
@@ -245,8 +268,8 @@ setup_bear_hub_env() {
     fi
     if [[ "${env_node_major:-0}" -lt 20 ]]; then
         echo "Ensuring a modern Node.js (>=20.19) in the 'bear-hub' env..."
-        "${MAMBA_BIN:-${CONDA_BIN}}" install -y -p "${BEAR_PREFIX}" \
-            -c conda-forge 'nodejs>=20.19'
+        "${SOLVER}" install -y -p "${BEAR_PREFIX}" \
+            "${CHANNEL_OPTS[@]}" -c conda-forge 'nodejs>=20.19'
     else
         echo "Node.js in 'bear-hub' env: $("${BEAR_PREFIX}/bin/node" --version 2>/dev/null) (OK)"
     fi
@@ -260,16 +283,36 @@ setup_bear_hub_env() {
     # the env is ever moved/cloned to a different path. `python -m` is portable.
     local app_dir="${BEAR_HUB_ROOT}/bearhub_rx"
     if [[ -f "${app_dir}/rxconfig.py" ]]; then
-        echo "Pre-compilando frontend Reflex em ${app_dir}/.web ..."
+        echo "Pre-compilando frontend Reflex em ${app_dir}/.web (em segundo plano)..."
+        # The export is CPU/npm-bound and independent of the bactopia env, so it
+        # runs in the background while Step 3 solves/downloads; main() waits for
+        # it (wait_precompile) before writing the config.
         # Put the env's bin first on PATH so the export's compress step uses the
         # env's modern node (via `which node`), not an old system node.
+        # Its output goes to a log so it doesn't interleave with the solver's
+        # progress, and `set -m` gives it its own process group so
+        # _kill_precompile can stop the whole tree.
+        mkdir -p "${CONFIG_DIR}"
+        set -m
         ( cd "${app_dir}" && PATH="${BEAR_PREFIX}/bin:${PATH}" \
             "${BEAR_PREFIX}/bin/python" -m reflex export --frontend-only \
-            --no-zip --loglevel warning 2>/dev/null ) || \
-            echo "  (pre-compile skipped — will build on first run)"
+            --no-zip --loglevel warning ) >"${PRECOMPILE_LOG}" 2>&1 &
+        PRECOMPILE_PID=$!
+        set +m
     fi
 }
 
+# Join the background frontend pre-compile started by setup_bear_hub_env.
+wait_precompile() {
+    [[ -n "${PRECOMPILE_PID}" ]] || return 0
+    echo
+    echo "Aguardando a pre-compilacao do frontend Reflex (log: ${PRECOMPILE_LOG})..."
+    if ! wait "${PRECOMPILE_PID}"; then
+        echo "  (pre-compile skipped — will build on first run; see ${PRECOMPILE_LOG})"
+    fi
+    PRECOMPILE_PID=""
+}
+
 # =============================================================================
 # Step 3: setup_bactopia_env — create the Bactopia/Nextflow environment
 # =============================================================================
@@ -282,18 +325,17 @@ setup_bactopia_env() {
     # Pin to the validated version (also pulls a compatible Nextflow + JDK,
     # >= 26.04 for 4.x). Check for the actual binary — not just the dir — so a
     # previous partial install (env dir created, package failed) gets repaired.
-    local solver="${MAMBA_BIN:-${CONDA_BIN}}"
     if [[ -x "${BACTOPIA_PREFIX}/bin/bactopia" ]]; then
         echo "Ambiente 'bactopia' ja existe em: ${BACTOPIA_PREFIX}"
     elif [[ -d "${BACTOPIA_PREFIX}" ]]; then
         echo "Reparando ambiente 'bactopia' incompleto (bactopia=${BACTOPIA_VERSION})..."
-        "${solver}" install -y -p "${BACTOPIA_PREFIX}" \
-            -c conda-forge -c bioconda "bactopia=${BACTOPIA_VERSION}"
+        "${SOLVER}" install -y -p "${BACTOPIA_PREFIX}" \
+            "${CHANNEL_OPTS[@]}" -c conda-forge -c bioconda "bactopia=${BACTOPIA_VERSION}"
     else
         echo "Criando ambiente 'bactopia' em ${BACTOPIA_PREFIX} com Bactopia ${BACTOPIA_VERSION}..."
         echo "  (o pipeline sera executado com '-profile docker' pelo BEAR-HUB)"
-        "${solver}" create -y -p "${BACTOPIA_PREFIX}" \
-            -c conda-forge -c bioconda "bactopia=${BACTOPIA_VERSION}"
+        "${SOLVER}" create -y -p "${BACTOPIA_PREFIX}" \
+            "${CHANNEL_OPTS[@]}" -c conda-forge -c bioconda "bactopia=${BACTOPIA_VERSION}"
         echo "Ambiente 'bactopia' criado em: ${BACTOPIA_PREFIX}"
     fi
 
@@ -307,49 +349,46 @@ setup_bactopia_env() {
 ensure_nextflow() {
     echo
     echo "Verificando nextflow no ambiente 'bactopia'..."
+    local bin_dir="${BACTOPIA_PREFIX}/bin"
+    local nf="${bin_dir}/nextflow"
 
-    if [[ -x "${BACTOPIA_PREFIX}/bin/nextflow" ]]; then
-        echo "nextflow ja encontrado em: ${BACTOPIA_PREFIX}/bin/nextflow"
+    if [[ -x "${nf}" ]]; then
+        echo "nextflow ja encontrado em: ${nf}"
         return 0
     fi
 
-    echo "nextflow nao encontrado em '${BACTOPIA_PREFIX}/bin/nextflow'."
+    echo "nextflow nao encontrado em '${nf}'."
     echo "Tentando instalar nextflow dentro do ambiente 'bactopia'..."
 
-    if [[ -n "${MAMBA_BIN}" ]]; then
-        "${MAMBA_BIN}" install -y -p "${BACTOPIA_PREFIX}" \
-            -c bioconda -c conda-forge nextflow || true
-    else
-        "${CONDA_BIN}" install -y -p "${BACTOPIA_PREFIX}" \
-            -c bioconda -c conda-forge nextflow || true
-    fi
+    "${SOLVER}" install -y -p "${BACTOPIA_PREFIX}" \
+        "${CHANNEL_OPTS[@]}" -c conda-forge -c bioconda nextflow || true
 
     # If conda/mamba install didn't produce the binary, download directly
-    if [[ ! -x "${BACTOPIA_PREFIX}/bin/nextflow" ]]; then
+    if [[ ! -x "${nf}" ]]; then
         echo
         echo "ATENCAO: 'nextflow' ainda nao foi encontrado."
         echo "Baixando nextflow pelo script oficial (get.nextflow.io)..."
 
-        mkdir -p "${BACTOPIA_PREFIX}/bin"
+        mkdir -p "${bin_dir}"
 
         if command -v curl >/dev/null 2>&1; then
-            curl -fsSL https://get.nextflow.io -o "${BACTOPIA_PREFIX}/bin/nextflow"
+            curl -fsSL https://get.nextflow.io -o "${nf}"
         elif command -v wget >/dev/null 2>&1; then
-            wget -qO "${BACTOPIA_PREFIX}/bin/nextflow" https://get.nextflow.io
+            wget -qO "${nf}" https://get.nextflow.io
         else
             echo
             echo "ERRO: nem 'curl' nem 'wget' encontrados para baixar nextflow."
             echo "Instale 'curl' ou 'wget' e rode novamente 'install_bear.sh',"
-            echo "ou instale manualmente o binario em '${BACTOPIA_PREFIX}/bin/nextflow'."
+            echo "ou instale manualmente o binario em '${nf}'."
             exit 1
         fi
 
-        chmod +x "${BACTOPIA_PREFIX}/bin/nextflow"
+        chmod +x "${nf}"
     fi
 
     # Final check
-    if [[ -x "${BACTOPIA_PREFIX}/bin/nextflow" ]]; then
-        echo "nextflow disponivel em: ${BACTOPIA_PREFIX}/bin/nextflow"
+    if [[ -x "${nf}" ]]; then
+        echo "nextflow disponivel em: ${nf}"
     else
         echo
         echo "ERRO: nao foi possivel garantir um 'nextflow' utilizavel."
@@ -365,9 +404,7 @@ write_config() {
     echo
     echo "=== Step 4: Writing configuration ==="
 
-    mkdir -p "${CONFIG_DIR}"
-    mkdir -p "${DATA_DIR}"
-    mkdir -p "${OUT_DIR}"
+    mkdir -p "${CONFIG_DIR}" "${DATA_DIR}" "${OUT_DIR}"
 
     # Determine NXF_CONDA_EXE (mamba preferred)
     local nxf_solver=""
@@ -378,6 +415,9 @@ write_config() {
         echo "AVISO: mamba nao encontrado, NXF_CONDA_EXE nao sera definido."
     fi
 
+    # Write to a temp file in the same dir and rename it into place, so an
+    # interrupted install never leaves a half-written config.env behind.
+    local tmp_cfg="${CONFIG_FILE}.tmp.$$"
     {
         echo "# Generated by install_bear.sh — edit to change default directories."
         echo "# This file is read by BEAR-HUB at startup (utils/system.py)."
@@ -397,7 +437,8 @@ write_config() {
         echo
         echo "# Pinned Bactopia version used during installation"
         echo "export BACTOPIA_VERSION=\"${BACTOPIA_VERSION}\""
-    } > "${CONFIG_FILE}"
+    } > "${tmp_cfg}"
+    mv -f "${tmp_cfg}" "${CONFIG_FILE}"
 
     echo "Config salva em: ${CONFIG_FILE}"
 }
@@ -500,6 +541,7 @@ main() {
     check_prerequisites
     setup_bear_hub_env
     setup_bactopia_env
+    wait_precompile
     write_config
     configure_reflex
 